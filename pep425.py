@@ -1,11 +1,12 @@
 """Provide support for PEP 425 compatibility tags triples."""
 
-import distutils.util
+import functools
+import itertools
 import os
-import os.path
 import platform
 import sys
 import sysconfig
+import weakref
 
 
 INTERPRETER_SHORT_NAMES = {
@@ -19,45 +20,93 @@ INTERPRETER_SHORT_NAMES = {
 
 _32_BIT_INTERPRETER = sys.maxsize <= 2 ** 32
 
+_CONFIG_VARS = sysconfig.get_config_vars()
 
-# A dataclass would be better, but Python 2.7. :(
+
+# Not a dataclass as slots=True needs Python 3.10 and frozen=True slows down
+# construction, which sys_tags() and parse_tag() do a lot of.
 class Tag:
 
     """Representation of the interpreter/ABI/platform tag triple as specified by PEP 425."""
 
+    __slots__ = ("_interpreter", "_abi", "_platform", "_hash", "_str", "__weakref__")
+
     def __init__(self, interpreter, abi, platform):
         """Initialize the instance attributes.
 
         All values are lowercased.
 
         """
-        self._tags = interpreter.lower(), abi.lower(), platform.lower()
+        self._interpreter = sys.intern(interpreter.lower())
+        self._abi = sys.intern(abi.lower())
+        self._platform = sys.intern(platform.lower())
+        self._hash = hash((self._interpreter, self._abi, self._platform))
+
+    @classmethod
+    def _make(cls, interpreter, abi, platform):
+        """Create an instance from values which are already lowercased."""
+        self = cls.__new__(cls)
+        self._interpreter = interpreter = sys.intern(interpreter)
+        self._abi = abi = sys.intern(abi)
+        self._platform = platform = sys.intern(platform)
+        self._hash = hash((interpreter, abi, platform))
+        return self
 
     def __eq__(self, other):
-        return self._tags == other._tags
+        if not isinstance(other, Tag):
+            return NotImplemented
+        return (
+            self._hash == other._hash  # Short-circuit ASAP for perf reasons.
+            and self._platform == other._platform
+            and self._abi == other._abi
+            and self._interpreter == other._interpreter
+        )
 
     def __hash__(self):
-        return hash(self._tags)
+        return self._hash
 
     def __str__(self):
-        return "-".join(self._tags)
+        # Most tags are never stringified, so only build the string on demand.
+        try:
+            return self._str
+        except AttributeError:
+            self._str = "-".join([self._interpreter, self._abi, self._platform])
+            return self._str
 
     def __repr__(self):
         return "<{self} @ {self_id}>".format(self=self, self_id=id(self))
 
+    def __reduce__(self):
+        return Tag, (self._interpreter, self._abi, self._platform)
+
     @property
     def interpreter(self):
-        return self._tags[0]
+        return self._interpreter
 
     @property
     def abi(self):
-        return self._tags[1]
+        return self._abi
 
     @property
     def platform(self):
-        return self._tags[2]
+        return self._platform
+
+
+# Tags handed out by _tag(); entries disappear once nothing else refers to them.
+_TAGS = weakref.WeakValueDictionary()
+
+
+def _tag(interpreter, abi, platform):
+    """Return a shared Tag instance for the tag triple."""
+    key = interpreter, abi, platform
+    try:
+        return _TAGS[key]
+    except KeyError:
+        tag = _TAGS[key] = Tag(interpreter, abi, platform)
+        return tag
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_tag(tag):
     """Parse the tag triple.
 
@@ -65,29 +114,32 @@ def parse_tag(tag):
     compressed tag triples.
 
     """
-    tags = set()
     interpreters, abis, platforms = tag.split("-")
-    for interpreter in interpreters.split("."):
-        for abi in abis.split("."):
-            for platform in platforms.split("."):
-                tags.add(Tag(interpreter, abi, platform))
-    return frozenset(tags)
+    if "." not in tag:
+        # Fast path for the common case of an uncompressed tag triple.
+        return frozenset([_tag(interpreters, abis, platforms)])
+    triples = itertools.product(
+        interpreters.split("."), abis.split("."), platforms.split(".")
+    )
+    return frozenset(itertools.starmap(_tag, triples))
 
 
 def parse_wheel_tag(path):
     """Parse the path of a wheel file for its tag triple(s)."""
-    name = os.path.splitext(path)[0]
-    parts = 3
-    index = len(name)
-    while parts:
-        index = name.rindex("-", 0, index)
-        parts -= 1
-    return parse_tag(name[index + 1 :])
+    return _parse_wheel_tag(os.fspath(path))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_wheel_tag(name):
+    if name[-4:].lower() == ".whl":
+        name = name[:-4]
+    _, interpreters, abis, platforms = name.rsplit("-", 3)
+    return parse_tag("-".join([interpreters, abis, platforms]))
 
 
 def _normalize_string(string):
     """Convert 'string' to be compatible as a tag."""
-    return string.replace(".", "_").replace("-", "_")
+    return string.replace(".", "_").replace("-", "_").lower()
 
 
 def _cpython_interpreter(py_version):
@@ -95,39 +147,35 @@ def _cpython_interpreter(py_version):
     return "cp{major}{minor}".format(major=py_version[0], minor=py_version[1])
 
 
+@functools.lru_cache(maxsize=1)
 def _cpython_abi(py_version):
     """Calcuate the ABI for this CPython interpreter."""
-    soabi = sysconfig.get_config_var("SOABI")
+    soabi = _CONFIG_VARS.get("SOABI")
     if soabi:
         _, options, _ = soabi.split("-", 2)
     else:
         found_options = [str(py_version[0]), str(py_version[1])]
-        if sysconfig.get_config_var("Py_DEBUG"):
+        if _CONFIG_VARS.get("Py_DEBUG"):
             found_options.append("d")
-        if sysconfig.get_config_var("WITH_PYMALLOC"):
+        if _CONFIG_VARS.get("WITH_PYMALLOC"):
             found_options.append("m")
-        if sysconfig.get_config_var("Py_UNICODE_SIZE") == 4:
+        if _CONFIG_VARS.get("Py_UNICODE_SIZE") == 4:
             found_options.append("u")
         options = "".join(found_options)
     return "cp{options}".format(options=options)
 
 
 def _cpython_tags(py_version, interpreter, abi, platforms):
-    for tag in (Tag(interpreter, abi, platform) for platform in platforms):
-        yield tag
-    # TODO: Make sure doing this on Windows isn't horrible.
-    for tag in (Tag(interpreter, "abi3", platform) for platform in platforms):
-        yield tag
-    for tag in (Tag(interpreter, "none", platform) for platform in platforms):
-        yield tag
+    # TODO: Make sure doing abi3 on Windows isn't horrible.
+    triples = itertools.product([interpreter], [abi, "abi3", "none"], platforms)
+    yield from itertools.starmap(Tag._make, triples)
     # PEP 384 was first implemented in Python 3.2.
-    for minor_version in range(py_version[1] - 1, 1, -1):
-        for platform in platforms:
-            yield Tag(
-                "cp{major}{minor}".format(major=py_version[0], minor=minor_version),
-                "abi3",
-                platform,
-            )
+    major = py_version[0]
+    abi3_interpreters = [
+        f"cp{major}{minor_version}" for minor_version in range(py_version[1] - 1, 1, -1)
+    ]
+    triples = itertools.product(abi3_interpreters, ["abi3"], platforms)
+    yield from itertools.starmap(Tag._make, triples)
 
 
 def _pypy_interpreter():
@@ -140,7 +188,7 @@ def _pypy_interpreter():
 
 def _generic_abi():
     """Get the ABI version for this interpreter."""
-    abi = sysconfig.get_config_var("SOABI")
+    abi = _CONFIG_VARS.get("SOABI")
     if abi:
         return _normalize_string(abi)
     else:
@@ -148,18 +196,14 @@ def _generic_abi():
 
 
 def _pypy_tags(py_version, interpreter, abi, platforms):
-    for tag in (Tag(interpreter, abi, platform) for platform in platforms):
-        yield tag
-    for tag in (Tag(interpreter, "none", platform) for platform in platforms):
-        yield tag
+    triples = itertools.product([interpreter], [abi, "none"], platforms)
+    yield from itertools.starmap(Tag._make, triples)
 
 
 def _generic_tags(interpreter, py_version, abi, platforms):
-    for tag in (Tag(interpreter, abi, platform) for platform in platforms):
-        yield tag
-    if abi != "none":
-        for tag in (Tag(interpreter, "none", platform) for platform in platforms):
-            yield tag
+    abis = [abi] if abi == "none" else [abi, "none"]
+    triples = itertools.product([interpreter], abis, platforms)
+    yield from itertools.starmap(Tag._make, triples)
 
 
 def _py_interpreter_range(py_version):
@@ -169,10 +213,11 @@ def _py_interpreter_range(py_version):
     all following versions up to 'end'.
 
     """
-    yield "py{major}{minor}".format(major=py_version[0], minor=py_version[1])
-    yield "py{major}".format(major=py_version[0])
+    prefix = f"py{py_version[0]}"
+    yield prefix + str(py_version[1])
+    yield prefix
     for minor in range(py_version[1] - 1, -1, -1):
-        yield "py{major}{minor}".format(major=py_version[0], minor=minor)
+        yield prefix + str(minor)
 
 
 def _independent_tags(interpreter, py_version, platforms):
@@ -183,12 +228,12 @@ def _independent_tags(interpreter, py_version, platforms):
     - <interpreter>-none-any
     - py*-none-any
     """
-    for version in _py_interpreter_range(py_version):
-        for platform in platforms:
-            yield Tag(version, "none", platform)
-    yield Tag(interpreter, "none", "any")
-    for version in _py_interpreter_range(py_version):
-        yield Tag(version, "none", "any")
+    versions = list(_py_interpreter_range(py_version))
+    triples = itertools.product(versions, ["none"], platforms)
+    yield from itertools.starmap(Tag._make, triples)
+    yield Tag._make(interpreter, "none", "any")
+    triples = itertools.product(versions, ["none"], ["any"])
+    yield from itertools.starmap(Tag._make, triples)
 
 
 def _mac_arch(arch, is_32bit=_32_BIT_INTERPRETER):
@@ -202,55 +247,50 @@ def _mac_arch(arch, is_32bit=_32_BIT_INTERPRETER):
         return arch
 
 
+# CPU architecture -> (earliest macOS version, latest macOS version, binary formats).
+_MAC_BINARY_FORMATS = {
+    "x86_64": ((10, 4), None, ("x86_64", "intel", "fat64", "fat32", "universal")),
+    "i386": ((10, 4), None, ("i386", "intel", "fat32", "fat", "universal")),
+    # TODO: Need to care about 32-bit PPC for ppc64 through 10.2?
+    "ppc64": ((10, 4), (10, 5), ("ppc64", "fat64", "universal")),
+    "ppc": (None, (10, 6), ("ppc", "fat32", "fat", "universal")),
+}
+
+
+@functools.lru_cache(maxsize=None)
 def _mac_binary_formats(version, cpu_arch):
     """Calculate the supported binary formats for the specified macOS version and architecture."""
-    formats = [cpu_arch]
-    if cpu_arch == "x86_64":
-        if version >= (10, 4):
-            formats.extend(["intel", "fat64", "fat32"])
-        else:
-            return []
-    elif cpu_arch == "i386":
-        if version >= (10, 4):
-            formats.extend(["intel", "fat32", "fat"])
-        else:
-            return []
-    elif cpu_arch == "ppc64":
-        # TODO: Need to care about 32-bit PPC for ppc64 through 10.2?
-        if version > (10, 5) or version < (10, 4):
-            return []
-        else:
-            formats.append("fat64")
-    elif cpu_arch == "ppc":
-        if version <= (10, 6):
-            formats.extend(["fat32", "fat"])
-        else:
-            return []
-
-    formats.append("universal")
+    try:
+        earliest, latest, formats = _MAC_BINARY_FORMATS[cpu_arch]
+    except KeyError:
+        return cpu_arch, "universal"
+    if (earliest and version < earliest) or (latest and version > latest):
+        return ()
     return formats
 
 
+# platform.mac_ver() reads from disk on every call.
+if sys.platform == "darwin":
+    _MAC_VER = platform.mac_ver()
+else:
+    _MAC_VER = "", ("", "", ""), ""
+
+
+@functools.lru_cache(maxsize=None)
 def _mac_platforms(version=None, arch=None):
     """Calculate the platform tags for macOS."""
-    version_str, _, cpu_arch = platform.mac_ver()
+    version_str, _, cpu_arch = _MAC_VER
     if version is None:
         version = tuple(map(int, version_str.split(".")[:2]))
     if arch is None:
         arch = _mac_arch(cpu_arch)
-    platforms = []
-    for minor_version in range(version[1], -1, -1):
-        compat_version = version[0], minor_version
-        binary_formats = _mac_binary_formats(compat_version, arch)
-        for binary_format in binary_formats:
-            platforms.append(
-                "macosx_{major}_{minor}_{binary_format}".format(
-                    major=compat_version[0],
-                    minor=compat_version[1],
-                    binary_format=binary_format,
-                )
-            )
-    return platforms
+    major = version[0]
+    return tuple(
+        f"macosx_{major}_{minor_version}_{binary_format}"
+        for minor_version in range(version[1], -1, -1)
+        for binary_format in _mac_binary_formats((major, minor_version), arch)
+    )
+
 
 # From PEP 513.
 def _is_manylinux_compatible(name, glibc_version):
@@ -267,16 +307,21 @@ def _is_manylinux_compatible(name, glibc_version):
 
 
 # From PEP 513.
-def _have_compatible_glibc(major, minimum_minor):
-    import ctypes
+def _glibc_version():
+    """Return the (major, minor) version of the glibc this process is linked against.
+
+    If the process isn't linked against glibc then None is returned.
 
-    process_namespace = ctypes.CDLL(None)
+    """
     try:
+        import ctypes
+
+        process_namespace = ctypes.CDLL(None)
         gnu_get_libc_version = process_namespace.gnu_get_libc_version
-    except AttributeError:
-        # Symbol doesn't exist -> therefore, we are not linked to
-        # glibc.
-        return False
+    except (ImportError, OSError, AttributeError):
+        # No ctypes or the symbol doesn't exist -> therefore, we can't tell
+        # if we are linked to glibc.
+        return None
 
     # Call gnu_get_libc_version, which returns a string like "2.5".
     gnu_get_libc_version.restype = ctypes.c_char_p
@@ -285,19 +330,33 @@ def _have_compatible_glibc(major, minimum_minor):
     if not isinstance(version_str, str):
         version_str = version_str.decode("ascii")
 
-    # Parse string and check against requested version.
-    version = [int(piece) for piece in version_str.split(".")]
-    assert len(version) == 2
-    if major != version[0]:
-        return False
-    if minimum_minor > version[1]:
+    # Parse string like "2.17"; anything past the minor version is ignored.
+    try:
+        major, minor = version_str.split(".")[:2]
+        return int(major), int(minor)
+    except ValueError:
+        return None
+
+
+_GLIBC_VERSION = _glibc_version() if sys.platform.startswith("linux") else None
+
+
+# From PEP 513.
+def _have_compatible_glibc(major, minimum_minor):
+    if _GLIBC_VERSION is None:
         return False
-    return True
+    return _GLIBC_VERSION[0] == major and _GLIBC_VERSION[1] >= minimum_minor
+
+
+@functools.lru_cache(maxsize=1)
+def _get_platform():
+    """Return the platform string of the running interpreter."""
+    return sysconfig.get_platform()
 
 
 def _linux_platforms(is_32bit=_32_BIT_INTERPRETER):
     """Return the supported platforms on Linux."""
-    linux = _normalize_string(distutils.util.get_platform())
+    linux = _normalize_string(_get_platform())
     if linux == "linux_x86_64" and is_32bit:
         linux = "linux_i686"
     # manylinux1: CentOS 5 w/ glibc 2.5.
@@ -317,10 +376,11 @@ def _linux_platforms(is_32bit=_32_BIT_INTERPRETER):
 
 
 def _generic_platforms():
-    platform = _normalize_string(distutils.util.get_platform())
+    platform = _normalize_string(_get_platform())
     return [platform]
 
 
+@functools.lru_cache(maxsize=1)
 def _interpreter_name():
     """Return the name of the running interpreter."""
     name = platform.python_implementation().lower()
@@ -328,12 +388,15 @@ def _interpreter_name():
 
 
 def _generic_interpreter(name, py_version):
-    version = sysconfig.get_config_var("py_version_nodot")
+    version = _CONFIG_VARS.get("py_version_nodot")
     if not version:
         version = "".join(py_version[:2])
     return "{name}{version}".format(name=name, version=version)
 
 
+_SYS_TAGS = None
+
+
 def sys_tags():
     """Return the sequence of tag triples for the running interpreter.
 
@@ -341,6 +404,26 @@ def sys_tags():
     from most to least important.
 
     """
+    global _SYS_TAGS
+    if _SYS_TAGS is None:
+        # Drop duplicates (e.g. a "py" interpreter overlaps with
+        # _independent_tags()) while keeping the priority order.
+        _SYS_TAGS = tuple(dict.fromkeys(_sys_tags()))
+    return _SYS_TAGS
+
+
+@functools.lru_cache(maxsize=1)
+def sys_tags_set():
+    """Return the tag triples for the running interpreter as a frozenset.
+
+    Use this instead of sys_tags() when only membership matters.
+
+    """
+    return frozenset(sys_tags())
+
+
+def _sys_tags():
+    """Generate the tag triples for the running interpreter."""
     py_version = sys.version_info[:2]
     interpreter_name = _interpreter_name()
     if platform.system() == "Darwin":
@@ -1,10 +1,10 @@
-import distutils.util
 import os.path
 
 try:
     import pathlib
 except ImportError:
     pathlib = None
+import pickle
 import platform
 import sys
 import sysconfig
@@ -15,29 +15,47 @@ import pytest
 import pep425
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def clear_caches(monkeypatch):
+    """Drop the per-process caches so monkeypatching takes effect."""
+    monkeypatch.setattr(pep425, "_SYS_TAGS", None)
+    pep425._cpython_abi.cache_clear()
+    pep425._interpreter_name.cache_clear()
+    pep425._get_platform.cache_clear()
+    pep425._mac_platforms.cache_clear()
+    pep425.sys_tags_set.cache_clear()
+
+
+@pytest.fixture(scope="session")
 def example_tag():
     return pep425.Tag("py3", "none", "any")
 
 
-def test_Tag_lowercasing():
-    tag = pep425.Tag("PY3", "None", "ANY")
+@pytest.mark.parametrize("args", [("py3", "none", "any"), ("PY3", "None", "ANY")])
+def test_Tag_behaviour(args):
+    tag = pep425.Tag(*args)
+    # Values are lowercased.
     assert tag.interpreter == "py3"
     assert tag.abi == "none"
     assert tag.platform == "any"
+    assert str(tag) == "py3-none-any"
+    assert tag == pep425.Tag(*args)
+    assert tag in {pep425.Tag("py3", "none", "any")}
 
 
-def test_Tag_equality():
-    args = "py3", "none", "any"
-    assert pep425.Tag(*args) == pep425.Tag(*args)
-
-
-def test_Tag_hashing(example_tag):
-    tags = {example_tag}  # Should not raise TypeError.
+def test_Tag_values_interned():
+    # Build the strings at runtime to avoid any compile-time interning.
+    tag = pep425.Tag(
+        "".join(["cp", "37"]), "".join(["cp", "37m"]), "".join(["an", "y"])
+    )
+    assert tag.interpreter is sys.intern("cp37")
+    assert tag.abi is sys.intern("cp37m")
+    assert tag.platform is sys.intern("any")
 
 
-def test_Tag_str(example_tag):
-    assert str(example_tag) == "py3-none-any"
+def test_Tag_inequality_with_other_types(example_tag):
+    assert example_tag != str(example_tag)
+    assert example_tag != ("py3", "none", "any")
 
 
 def test_Tag_repr(example_tag):
@@ -46,10 +64,48 @@ def test_Tag_repr(example_tag):
     )
 
 
-def test_Tag_attribute_access(example_tag):
-    assert example_tag.interpreter == "py3"
-    assert example_tag.abi == "none"
-    assert example_tag.platform == "any"
+def test_Tag__make(example_tag):
+    tag = pep425.Tag._make("py3", "none", "any")
+    assert tag == example_tag
+    assert hash(tag) == hash(example_tag)
+    assert str(tag) == str(example_tag)
+
+
+def test_Tag__make_values_interned():
+    tag = pep425.Tag._make("".join(["cp", "37"]), "abi3", "".join(["an", "y"]))
+    assert tag.interpreter is sys.intern("cp37")
+    assert tag.platform is sys.intern("any")
+
+
+def test_Tag_slots(example_tag):
+    assert not hasattr(example_tag, "__dict__")
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_Tag_pickling(example_tag, protocol):
+    tag = pickle.loads(pickle.dumps(example_tag, protocol))
+    assert tag == example_tag
+    assert str(tag) == str(example_tag)
+
+
+@pytest.mark.parametrize("attr", ["interpreter", "abi", "platform"])
+def test_Tag_read_only(attr):
+    tag = pep425.Tag("py3", "none", "any")
+    with pytest.raises(AttributeError):
+        setattr(tag, attr, "win32")
+    with pytest.raises(AttributeError):
+        delattr(tag, attr)
+
+
+def test__tag_interning(example_tag):
+    tag = pep425._tag("py3", "none", "any")
+    assert tag == example_tag
+    assert tag is pep425._tag("py3", "none", "any")
+
+
+def test__tag_interning_does_not_keep_tags_alive():
+    pep425._tag("py3", "none", "unreferenced")
+    assert ("py3", "none", "unreferenced") not in pep425._TAGS
 
 
 def test_parse_tag_simple(example_tag):
@@ -80,6 +136,10 @@ def test_parse_tag_multi_platform():
     assert given == expected
 
 
+def test_parse_tag_cached():
+    assert pep425.parse_tag("py3-none-any") is pep425.parse_tag("py3-none-any")
+
+
 def test_parse_wheel_tag_simple(example_tag):
     given = pep425.parse_wheel_tag("gidgethub-3.0.0-py3-none-any.whl")
     assert given == {example_tag}
@@ -96,6 +156,23 @@ def test_parse_wheel_tag_path(example_tag):
         assert given == {example_tag}
 
 
+def test_parse_wheel_tag_uppercase_extension(example_tag):
+    path = os.path.join("some", "location", "gidgethub-3.0.0-py3-none-any.WHL")
+    assert pep425.parse_wheel_tag(path) == {example_tag}
+
+
+def test_parse_wheel_tag_unhashable_path_like(example_tag):
+    class WheelPath:
+        # Defining __eq__ without __hash__ leaves instances unhashable.
+        def __eq__(self, other):
+            return NotImplemented
+
+        def __fspath__(self):
+            return "gidgethub-3.0.0-py3-none-any.whl"
+
+    assert pep425.parse_wheel_tag(WheelPath()) == {example_tag}
+
+
 def test_parse_wheel_tag_multi_interpreter(example_tag):
     expected = {example_tag, pep425.Tag("py2", "none", "any")}
     given = pep425.parse_wheel_tag("pip-18.0-py2.py3-none-any.whl")
@@ -127,32 +204,39 @@ def test_macOS_architectures(arch, is_32bit, expected):
     assert pep425._mac_arch(arch, is_32bit=is_32bit) == expected
 
 
-@pytest.mark.parametrize(
-    "version,arch,expected",
-    [
-        ((10, 17), "x86_64", ["x86_64", "intel", "fat64", "fat32", "universal"]),
-        ((10, 4), "x86_64", ["x86_64", "intel", "fat64", "fat32", "universal"]),
-        ((10, 3), "x86_64", []),
-        ((10, 17), "i386", ["i386", "intel", "fat32", "fat", "universal"]),
-        ((10, 4), "i386", ["i386", "intel", "fat32", "fat", "universal"]),
-        ((10, 3), "i386", []),
-        ((10, 17), "ppc64", []),
-        ((10, 6), "ppc64", []),
-        ((10, 5), "ppc64", ["ppc64", "fat64", "universal"]),
-        ((10, 3), "ppc64", []),
-        ((10, 17), "ppc", []),
-        ((10, 7), "ppc", []),
-        ((10, 6), "ppc", ["ppc", "fat32", "fat", "universal"]),
-        ((10, 0), "ppc", ["ppc", "fat32", "fat", "universal"]),
-    ],
+_MAC_FMT_CASES = (
+    ((10, 17), "x86_64", ("x86_64", "intel", "fat64", "fat32", "universal")),
+    ((10, 4), "x86_64", ("x86_64", "intel", "fat64", "fat32", "universal")),
+    ((10, 3), "x86_64", ()),
+    ((10, 17), "i386", ("i386", "intel", "fat32", "fat", "universal")),
+    ((10, 4), "i386", ("i386", "intel", "fat32", "fat", "universal")),
+    ((10, 3), "i386", ()),
+    ((10, 17), "ppc64", ()),
+    ((10, 6), "ppc64", ()),
+    ((10, 5), "ppc64", ("ppc64", "fat64", "universal")),
+    ((10, 3), "ppc64", ()),
+    ((10, 17), "ppc", ()),
+    ((10, 7), "ppc", ()),
+    ((10, 6), "ppc", ("ppc", "fat32", "fat", "universal")),
+    ((10, 0), "ppc", ("ppc", "fat32", "fat", "universal")),
+    ((10, 17), "arm64", ("arm64", "universal")),
 )
+
+
+@pytest.mark.parametrize("version,arch,expected", _MAC_FMT_CASES)
 def test_macOS_binary_formats(version, arch, expected):
     assert pep425._mac_binary_formats(version, arch) == expected
 
 
+def test_mac_platforms_cached():
+    assert pep425._mac_platforms((10, 5), "x86_64") is pep425._mac_platforms(
+        (10, 5), "x86_64"
+    )
+
+
 def test_mac_platforms():
     platforms = pep425._mac_platforms((10, 5), "x86_64")
-    assert platforms == [
+    assert platforms == (
         "macosx_10_5_x86_64",
         "macosx_10_5_intel",
         "macosx_10_5_fat64",
@@ -163,7 +247,7 @@ def test_mac_platforms():
         "macosx_10_4_fat64",
         "macosx_10_4_fat32",
         "macosx_10_4_universal",
-    ]
+    )
 
     assert len(pep425._mac_platforms((10, 17), "x86_64")) == 14 * 5
 
@@ -172,10 +256,8 @@ def test_mac_platforms():
 
 def test_macOS_version_detection(monkeypatch):
     if platform.system() != "Darwin":
-        monkeypatch.setattr(
-            platform, "mac_ver", lambda: ("10.14", ("", "", ""), "x86_64")
-        )
-    version = platform.mac_ver()[0].split(".")
+        monkeypatch.setattr(pep425, "_MAC_VER", ("10.14", ("", "", ""), "x86_64"))
+    version = pep425._MAC_VER[0].split(".")
     expected = "macosx_{major}_{minor}".format(major=version[0], minor=version[1])
     platforms = pep425._mac_platforms(arch="x86_64")
     assert platforms[0].startswith(expected)
@@ -183,8 +265,8 @@ def test_macOS_version_detection(monkeypatch):
 
 @pytest.mark.parametrize("arch", ["x86_64", "i386"])
 def test_macOS_arch_detection(arch, monkeypatch):
-    if platform.system() != "Darwin" or platform.mac_ver()[2] != arch:
-        monkeypatch.setattr(platform, "mac_ver", lambda: ("10.14", ("", "", ""), arch))
+    if platform.system() != "Darwin" or pep425._MAC_VER[2] != arch:
+        monkeypatch.setattr(pep425, "_MAC_VER", ("10.14", ("", "", ""), arch))
     assert pep425._mac_platforms((10, 14))[0].endswith(arch)
 
 
@@ -192,10 +274,8 @@ def test_cpython_abi_py3(monkeypatch):
     if platform.python_implementation() != "CPython" or not sysconfig.get_config_var(
         "SOABI"
     ):
-        monkeypatch.setattr(
-            sysconfig, "get_config_var", lambda key: "'cpython-37m-darwin'"
-        )
-    _, soabi, _ = sysconfig.get_config_var("SOABI").split("-", 2)
+        monkeypatch.setattr(pep425, "_CONFIG_VARS", {"SOABI": "'cpython-37m-darwin'"})
+    _, soabi, _ = pep425._CONFIG_VARS["SOABI"].split("-", 2)
     assert "cp{soabi}".format(soabi=soabi) == pep425._cpython_abi(sys.version_info[:2])
 
 
@@ -217,7 +297,7 @@ def test_cpython_abi_py2(debug, pymalloc, unicode_width, monkeypatch):
     ):
         if debug != sysconfig.get_config_var("Py_DEBUG") or pymalloc != sysconfig.get_config_var("WITH_PYMALLOC") or sysconfig.get_config_var("Py_UNICODE_SIZE") != unicode_width:
             config_vars = {"SOABI": None, "Py_DEBUG": int(debug), "WITH_PYMALLOC": int(pymalloc), "Py_UNICODE_SIZE": unicode_width}
-            monkeypatch.setattr(sysconfig, "get_config_var", config_vars.__getitem__)
+            monkeypatch.setattr(pep425, "_CONFIG_VARS", config_vars)
         options = ""
         if debug:
             options += "d"
@@ -329,10 +409,19 @@ def test_generic_interpreter():
 
 
 def test_generic_platforms():
-    platform = distutils.util.get_platform().replace("-", "_").replace(".", "_")
+    platform = sysconfig.get_platform().replace("-", "_").replace(".", "_")
     assert pep425._generic_platforms() == [platform]
 
 
+def test_generic_platforms_lowercased(monkeypatch):
+    monkeypatch.setattr(platform, "system", lambda: "FreeBSD")
+    monkeypatch.setattr(pep425, "_get_platform", lambda: "FreeBSD-12.1-RELEASE-amd64")
+    expected = "freebsd_12_1_release_amd64"
+    assert pep425._generic_platforms() == [expected]
+    platforms = {tag.platform for tag in pep425.sys_tags()}
+    assert platforms == {expected, "any"}
+
+
 def test_generic_tags():
     tags = list(pep425._generic_tags("sillywalk33", (3, 3), "abi", ["plat1", "plat2"]))
     assert tags == [
@@ -390,17 +479,47 @@ def test_have_compatible_glibc():
     assert pep425._have_compatible_glibc(2, 0)
 
 
+@pytest.mark.skipif(platform.system() != "Linux", reason="requires Linux/glibc")
+def test_glibc_version():
+    major, minor = pep425._glibc_version()
+    assert isinstance(major, int)
+    assert isinstance(minor, int)
+
+
+def test_glibc_version_without_ctypes(monkeypatch):
+    monkeypatch.setitem(sys.modules, "ctypes", None)
+    assert pep425._glibc_version() is None
+
+
+def test_glibc_version_unparsable(monkeypatch):
+    import ctypes
+
+    libc = types.SimpleNamespace(gnu_get_libc_version=lambda: b"unknown")
+    monkeypatch.setattr(ctypes, "CDLL", lambda name: libc)
+    assert pep425._glibc_version() is None
+
+
+def test_have_compatible_glibc_cached_version(monkeypatch):
+    monkeypatch.setattr(pep425, "_GLIBC_VERSION", (2, 17))
+    assert pep425._have_compatible_glibc(2, 5)
+    assert pep425._have_compatible_glibc(2, 17)
+    assert not pep425._have_compatible_glibc(2, 18)
+    assert not pep425._have_compatible_glibc(3, 0)
+    monkeypatch.setattr(pep425, "_GLIBC_VERSION", None)
+    assert not pep425._have_compatible_glibc(2, 5)
+
+
 def test_linux_platforms_64bit_on_64bit(monkeypatch):
-    if platform.system() != "Linux" or distutils.util.get_platform().endswith("_x86_64"):
-        monkeypatch.setattr(distutils.util, "get_platform", lambda: "linux_x86_64")
+    if platform.system() != "Linux" or sysconfig.get_platform().endswith("_x86_64"):
+        monkeypatch.setattr(pep425, "_get_platform", lambda: "linux_x86_64")
         monkeypatch.setattr(pep425, "_is_manylinux_compatbible", lambda *args: False)
     linux_platform = pep425._linux_platforms(is_32bit=False)[-1]
     assert linux_platform == "linux_x86_64"
 
 
 def test_linux_platforms_32bit_linux_on_64bit_OS():
-    if platform.system() != "Linux" or distutils.util.get_platform().endswith("_i686"):
-        monkeypatch.setattr(distutils.util, "get_platform", lambda: "linux_i686")
+    if platform.system() != "Linux" or sysconfig.get_platform().endswith("_i686"):
+        monkeypatch.setattr(pep425, "_get_platform", lambda: "linux_i686")
         monkeypatch.setattr(pep425, "_is_manylinux_compatbible", lambda *args: False)
     linux_platform = pep425._linux_platforms(is_32bit=True)[-1]
     assert linux_platform == "linux_i686"
@@ -409,7 +528,7 @@ def test_linux_platforms_32bit_linux_on_64bit_OS():
 def test_linux_platforms_manylinux1(monkeypatch):
     monkeypatch.setattr(pep425, "_is_manylinux_compatible", lambda name, _: name == "manylinux1")
     if platform.system() != "Linux":
-        monkeypatch.setattr(distutils.util, "get_platform", lambda: "linux_x86_64")
+        monkeypatch.setattr(pep425, "_get_platform", lambda: "linux_x86_64")
     platforms = pep425._linux_platforms(is_32bit=False)
     assert platforms == ["manylinux1_x86_64", "linux_x86_64"]
 
@@ -417,7 +536,7 @@ def test_linux_platforms_manylinux1(monkeypatch):
 def test_linux_platforms_manylinux2010(monkeypatch):
     monkeypatch.setattr(pep425, "_is_manylinux_compatible", lambda name, _: name == "manylinux2010")
     if platform.system() != "Linux":
-        monkeypatch.setattr(distutils.util, "get_platform", lambda: "linux_x86_64")
+        monkeypatch.setattr(pep425, "_get_platform", lambda: "linux_x86_64")
     platforms = pep425._linux_platforms(is_32bit=False)
     assert platforms == ["manylinux2010_x86_64", "manylinux1_x86_64", "linux_x86_64"]
 
@@ -438,3 +557,24 @@ def test_sys_tags_linux_cpython(monkeypatch):
         platforms[0],
     )
     assert tags[-1] == pep425.Tag("py{}0".format(sys.version_info[0]), "none", "any")
+
+
+def test_sys_tags_cached():
+    tags = list(pep425.sys_tags())
+    assert tags
+    assert list(pep425.sys_tags()) == tags
+    assert pep425.sys_tags() is pep425.sys_tags()
+
+
+def test_sys_tags_set():
+    tags = pep425.sys_tags_set()
+    assert isinstance(tags, frozenset)
+    assert tags == set(pep425.sys_tags())
+
+
+def test_sys_tags_no_duplicates(monkeypatch):
+    monkeypatch.setattr(pep425, "_interpreter_name", lambda: "py")
+    monkeypatch.setattr(pep425, "_generic_interpreter", lambda name, py_version: "py33")
+    monkeypatch.setattr(pep425, "_generic_abi", lambda: "none")
+    tags = list(pep425.sys_tags())
+    assert len(tags) == len(set(tags))